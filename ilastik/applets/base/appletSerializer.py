@@ -88,22 +88,27 @@ def slicingToString(slicing):
     return strSlicing.encode("utf-8")
 
 
+_SLICE_RE = re.compile(r"\s*([+-]?\d+)\s*:\s*([+-]?\d+)\s*")
+
+
 def stringToSlicing(strSlicing):
     """Parse a string of the form '[0:1,2:3,4:5]' into a slicing (i.e.
     list of slices)
 
+    Raises ValueError if strSlicing is not of that form.
     """
     if isinstance(strSlicing, bytes):
         strSlicing = strSlicing.decode("utf-8")
 
+    if not (strSlicing.startswith("[") and strSlicing.endswith("]")):
+        raise ValueError(f"Invalid slicing string: {strSlicing!r}")
+
     slicing = []
-    strSlicing = strSlicing[1:-1]  # Drop brackets
-    sliceStrings = strSlicing.split(",")
-    for s in sliceStrings:
-        ends = s.split(":")
-        start = int(ends[0])
-        stop = int(ends[1])
-        slicing.append(slice(start, stop))
+    for s in strSlicing[1:-1].split(","):  # Drop brackets
+        match = _SLICE_RE.fullmatch(s)
+        if match is None:
+            raise ValueError(f"Invalid slicing string: {strSlicing!r}")
+        slicing.append(slice(int(match.group(1)), int(match.group(2))))
 
     return slicing
 
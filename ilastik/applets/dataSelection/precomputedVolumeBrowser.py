@@ -107,6 +107,8 @@ class PrecomputedVolumeBrowser(QDialog):
             f"using scale: {rv._use_scale}\n"
             f"data shape: {rv.get_shape()}\n"
         )
+        # the volume was only needed to check the url
+        rv.close()
         self.qbuttons.button(QDialogButtonBox.Ok).setEnabled(True)
 
 
@@ -43,10 +43,15 @@ import warnings
 
 class TreeNode(QTreeWidgetItem):
     _updated = False
-    _children = {}
     _id = None
     _size_index = 1
 
+    def __init__(self, *args, **kwargs):
+        super(TreeNode, self).__init__(*args, **kwargs)
+        # child nodes by report id, owned by this node only so that entries
+        # of removed caches can be dropped together with their tree items
+        self._children = {}
+
     def handleChildrenReports(self, reports, root=None):
         if root is None:
             root = self
@@ -55,9 +60,10 @@ class TreeNode(QTreeWidgetItem):
             child._setData(report)
             child.handleChildrenReports(report.children)
             child._updated = True
-        for child in [self.child(i) for i in range(self.childCount())]:
+        for child in [root.child(i) for i in range(root.childCount())]:
             if not child._updated:
                 root.removeChild(child)
+                self._children.pop(child._id, None)
             child._updated = False
 
     def _childFromReport(self, report, root):
@@ -48,6 +48,12 @@ from volumina.view3d.volumeRendering import RenderingManager
 # ilastik
 from ilastik.utility import bind
 from ilastik.applets.labeling.labelingGui import LabelingGui
+from ilastik.workflows.carving.colortables import (
+    DONE_SEGMENTATION_UNICOLOR_COLORTABLE,
+    TRANSPARENT,
+    done_segmentation_colortable,
+    random_colortable,
+)
 
 
 import logging
@@ -225,17 +231,7 @@ class CarvingGui(LabelingGui):
         addLayerToggleShortcut("Segmentation", "s")
         addLayerToggleShortcut("Input Data", "r")
 
-        def makeColortable():
-            self._doneSegmentationColortable = [QColor(0, 0, 0, 0).rgba()]
-            for i in range(254):
-                r, g, b = numpy.random.randint(0, 255), numpy.random.randint(0, 255), numpy.random.randint(0, 255)
-                # ensure colors have sufficient distance to pure red and pure green
-                while (255 - r) + g + b < 128 or r + (255 - g) + b < 128:
-                    r, g, b = numpy.random.randint(0, 255), numpy.random.randint(0, 255), numpy.random.randint(0, 255)
-                self._doneSegmentationColortable.append(QColor(r, g, b).rgba())
-            self._doneSegmentationColortable.append(QColor(0, 255, 0).rgba())
-
-        makeColortable()
+        self._doneSegmentationColortable = done_segmentation_colortable()
         self._updateGui()
 
     @property
@@ -719,10 +715,8 @@ class CarvingGui(LabelingGui):
             # source.setRelabeling(numpy.arange(256, dtype=numpy.uint8))
 
             # assign to the object label color, 0 is transparent, 1 is background
-            colortable = [QColor(0, 0, 0, 0).rgba(), QColor(0, 0, 0, 0).rgba(), labellayer._colorTable[2]]
-            for i in range(256 - len(colortable)):
-                r, g, b = numpy.random.randint(0, 255), numpy.random.randint(0, 255), numpy.random.randint(0, 255)
-                colortable.append(QColor(r, g, b).rgba())
+            colortable = [TRANSPARENT, TRANSPARENT, labellayer._colorTable[2]]
+            colortable += random_colortable(256 - len(colortable))
 
             layer = ColortableLayer(createDataSource(seg), colortable, direct=True)
             layer.name = "Segmentation"
@@ -737,13 +731,10 @@ class CarvingGui(LabelingGui):
         # done
         doneSeg = self.topLevelOperatorView.DoneSegmentation
         if doneSeg.ready():
-            # FIXME: if the user segments more than 255 objects, those with indices that divide by 255 will be shown as transparent
-            # both here and in the _doneSegmentationColortable
-            colortable = 254 * [QColor(230, 25, 75).rgba()]
-            colortable.insert(0, QColor(0, 0, 0, 0).rgba())
-
             # have to use lazyflow because it provides dirty signals
-            layer = ColortableLayer(createDataSource(doneSeg), colortable, direct=True)
+            layer = ColortableLayer(
+                createDataSource(doneSeg), list(DONE_SEGMENTATION_UNICOLOR_COLORTABLE), direct=True
+            )
             layer.name = "Completed segments (unicolor)"
             layer.setToolTip(
                 "In order to keep track of which objects you have already completed, this layer "
@@ -771,11 +762,7 @@ class CarvingGui(LabelingGui):
         # supervoxel
         sv = self.topLevelOperatorView.Supervoxels
         if sv.ready():
-            colortable = []
-            for i in range(256):
-                r, g, b = numpy.random.randint(0, 255), numpy.random.randint(0, 255), numpy.random.randint(0, 255)
-                colortable.append(QColor(r, g, b).rgba())
-            layer = ColortableLayer(createDataSource(sv), colortable, direct=True)
+            layer = ColortableLayer(createDataSource(sv), random_colortable(256), direct=True)
             layer.name = "Supervoxels"
             layer.setToolTip(
                 "<html>This layer shows the partitioning of the input image into <b>supervoxels</b>. The carving "
@@ -1,7 +1,7 @@
 from multiprocessing import cpu_count
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
 from math import ceil
-from functools import partial
+from functools import partial, lru_cache
 
 import numpy
 import vigra
@@ -27,6 +27,22 @@ def choose_channel(data, sigma, function, channel):
     return function(data, sigma)[..., channel]
 
 
+@lru_cache(maxsize=None)
+def _get_executor(max_workers):
+    """ Get a thread pool with max_workers threads that is shared between calls.
+
+    Spinning up (and joining) a fresh pool for every call is expensive compared
+    to the work done for small inputs, so we keep one pool per thread count alive.
+    The pools are never shut down: they live for the whole process, their idle
+    worker threads are joined by concurrent.futures at interpreter exit.
+    Concurrent callers with the same max_workers (e.g. several lanes) share one
+    pool, so together they use max_workers threads instead of max_workers each.
+    Callers wait for all of their tasks before collecting the results, so that
+    no block of a failed call is still running on the pool afterwards.
+    """
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
 def parallel_filter(filter_name, data, sigma, max_workers, block_shape=None, outer_scale=None, return_channel=None):
     """ Compute fiter response parallel over blocks.
     """
@@ -98,9 +114,10 @@ def parallel_filter(filter_name, data, sigma, max_workers, block_shape=None, out
 
         response[inner_slicing] = block_response[inner_local_slicing]
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        tasks = [executor.submit(filter_block, block_index) for block_index in range(blocking.numberOfBlocks)]
-        [t.result() for t in tasks]
+    executor = _get_executor(max_workers)
+    tasks = [executor.submit(filter_block, block_index) for block_index in range(blocking.numberOfBlocks)]
+    wait(tasks)
+    [t.result() for t in tasks]
 
     return response
 
@@ -151,10 +168,12 @@ def parallel_watershed(data, block_shape=None, halo=None, max_workers=None):
         # return the max-id for this block, that will be used as offset
         return inner_block_labels.max()
 
+    executor = _get_executor(max_workers)
+
     # run the watershed blocks in parallel
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        tasks = [executor.submit(ws_block, block_index) for block_index in range(n_blocks)]
-        offsets = numpy.array([t.result() for t in tasks], dtype="int64")  # TODO uint32
+    tasks = [executor.submit(ws_block, block_index) for block_index in range(n_blocks)]
+    wait(tasks)
+    offsets = numpy.array([t.result() for t in tasks], dtype="int64")  # TODO uint32
 
     # compute the block offsets and the max id
     last_max_id = offsets[-1]
@@ -170,9 +189,9 @@ def parallel_watershed(data, block_shape=None, halo=None, max_workers=None):
         labels[block] += offsets[block_index]
 
     # add offsets in parallel
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        tasks = [executor.submit(add_offset_block, block_index) for block_index in range(n_blocks)]
-        [t.result() for t in tasks]
+    tasks = [executor.submit(add_offset_block, block_index) for block_index in range(n_blocks)]
+    wait(tasks)
+    [t.result() for t in tasks]
 
     return labels, max_id
 
@@ -0,0 +1,77 @@
+###############################################################################
+#   ilastik: interactive learning and segmentation toolkit
+#
+#       Copyright (C) 2011-2020, the ilastik developers
+#                                <team@ilastik.org>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# In addition, as a special exception, the copyright holders of
+# ilastik give you permission to combine ilastik with applets,
+# workflows and plugins which are not covered under the GNU
+# General Public License.
+#
+# See the LICENSE file for details. License information is also available
+# on the ilastik web site at:
+# 		   http://ilastik.org/license.html
+###############################################################################
+"""Colortables shared by the carving and preprocessing viewer GUIs"""
+from functools import lru_cache
+
+import numpy
+from PyQt5.QtGui import QColor
+
+TRANSPARENT = QColor(0, 0, 0, 0).rgba()
+GREEN = QColor(0, 255, 0).rgba()
+# FIXME: if the user segments more than 255 objects, those with indices that divide by 255 will be shown as transparent
+# both here and in the _doneSegmentationColortable
+DONE_SEGMENTATION_UNICOLOR_COLORTABLE = (TRANSPARENT,) + 254 * (QColor(230, 25, 75).rgba(),)
+
+# Every table draws from its own seeded generator, so that random label colors are
+# the same in every session, regardless of the order in which the tables are created
+_SEED = 0x11A5
+
+
+def _random_rgb(rng, num_colors):
+    return rng.integers(0, 255, size=(num_colors, 3), dtype=numpy.uint32)
+
+
+def pack_rgb(rgb):
+    """Pack an (N, 3) uint32 array of r, g, b values into opaque colors, as QColor(r, g, b).rgba() would"""
+    return (0xFF000000 | (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]).tolist()
+
+
+@lru_cache(maxsize=None)
+def _cached_random_colortable(num_colors):
+    rng = numpy.random.default_rng((_SEED, num_colors))
+    return tuple(pack_rgb(_random_rgb(rng, num_colors)))
+
+
+def random_colortable(num_colors):
+    """Colortable of num_colors random opaque colors
+
+    The table for a given size is only generated once per process,
+    so layers keep their colors when they are set up again.
+    """
+    return list(_cached_random_colortable(num_colors))
+
+
+def done_segmentation_colortable():
+    """Colortable for completed segments: transparent, 254 random colors, green
+
+    The random colors keep a sufficient distance to pure red and pure green.
+    """
+    rng = numpy.random.default_rng((_SEED, 0))
+    rgb = _random_rgb(rng, 254)
+    while True:
+        # ensure colors have sufficient distance to pure red and pure green
+        r, g, b = rgb.astype(numpy.int64).T
+        too_close = ((255 - r) + g + b < 128) | (r + (255 - g) + b < 128)
+        if not too_close.any():
+            break
+        rgb[too_close] = _random_rgb(rng, too_close.sum())
+
+    return [TRANSPARENT] + pack_rgb(rgb) + [GREEN]
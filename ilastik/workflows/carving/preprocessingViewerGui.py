@@ -18,16 +18,12 @@
 # on the ilastik web site at:
 # 		   http://ilastik.org/license.html
 ###############################################################################
-from builtins import range
-import numpy
-
-from PyQt5.QtGui import QColor
-
 from volumina.api import createDataSource
 from volumina.layer import ColortableLayer
 
 # ilastik
 from ilastik.applets.layerViewer.layerViewerGui import LayerViewerGui
+from ilastik.workflows.carving.colortables import random_colortable
 
 
 class PreprocessingViewerGui(LayerViewerGui):
@@ -41,11 +37,7 @@ class PreprocessingViewerGui(LayerViewerGui):
         # Supervoxels
         watershedSlot = opLane.WatershedImage
         if watershedSlot.ready():
-            colortable = []
-            for i in range(256):
-                r, g, b = numpy.random.randint(0, 255), numpy.random.randint(0, 255), numpy.random.randint(0, 255)
-                colortable.append(QColor(r, g, b).rgba())
-            watershedLayer = ColortableLayer(createDataSource(watershedSlot), colortable)
+            watershedLayer = ColortableLayer(createDataSource(watershedSlot), random_colortable(256))
             watershedLayer.name = "Watershed"
             watershedLayer.visible = False
 
@@ -176,16 +176,24 @@ class OpFormattedDataExport(Operator):
             #  which transforms the drange correctly in this case.
             self._opDrangeInjection.Metadata.setValue({"drange": (minVal, maxVal)})
 
+            numerator = numpy.float64(outputMaxVal) - numpy.float64(outputMinVal)
+            denominator = numpy.float64(maxVal) - numpy.float64(minVal)
+            if denominator != 0.0:
+                frac = numpy.float32(numerator / denominator)
+            else:
+                # Denominator was zero.  The user is probably just temporarily changing the values.
+                frac = numpy.float32(0.0)
+
             def normalize(a):
-                numerator = numpy.float64(outputMaxVal) - numpy.float64(outputMinVal)
-                denominator = numpy.float64(maxVal) - numpy.float64(minVal)
-                if denominator != 0.0:
-                    frac = numpy.float32(numerator / denominator)
+                # Same as outputMinVal + (a - minVal) * frac, but all steps after the
+                # subtraction work in-place on the first temporary (if it is a float array)
+                result = a - minVal
+                if result.dtype.kind == "f":
+                    result *= frac
                 else:
-                    # Denominator was zero.  The user is probably just temporarily changing the values.
-                    frac = numpy.float32(0.0)
-                result = numpy.asarray(outputMinVal + (a - minVal) * frac, export_dtype)
-                return result
+                    result = result * frac
+                result += outputMinVal
+                return numpy.asarray(result, export_dtype)
 
             self._opNormalizeAndConvert.Function.setValue(normalize)
 
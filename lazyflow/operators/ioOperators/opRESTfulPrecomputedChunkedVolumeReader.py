@@ -22,9 +22,11 @@
 import os
 import copy
 import tempfile
+from functools import partial
 import h5py
 import vigra
 from lazyflow.graph import Operator, InputSlot, OutputSlot
+from lazyflow.request import Request, RequestPool
 from lazyflow.utility.io_util.RESTfulPrecomputedChunkedVolume import RESTfulPrecomputedChunkedVolume
 from lazyflow.operators.opBlockedArrayCache import OpBlockedArrayCache
 import lazyflow.roi
@@ -65,7 +67,9 @@ class OpRESTfulPrecomputedChunkedVolumeReaderNoCache(Operator):
             # check if the volume url has changed, to avoid downloading
             # info twice (i.e. setting up the volume twice)
             if self._volume_object.volume_url == self.BaseUrl.value:
+                self._set_ideal_blockshape(self.Scale.value)
                 return
+            self._volume_object.close()
 
         self._volume_object = RESTfulPrecomputedChunkedVolume(self.BaseUrl.value)
 
@@ -81,6 +85,12 @@ class OpRESTfulPrecomputedChunkedVolumeReaderNoCache(Operator):
         # override whatever was set before to the lowest available scale:
         # is this a good idea? Triggers setupOutputs again
         self.Scale.setValue(self._volume_object._use_scale)
+        self._set_ideal_blockshape(self._volume_object._use_scale)
+
+    def _set_ideal_blockshape(self, scale):
+        # chunks of the remote volume, so that caches downstream download every chunk once
+        block_shape = self._volume_object.get_block_shape(scale)
+        self.Output.meta.ideal_blockshape = tuple(int(s) for s in block_shape)
 
     @staticmethod
     def get_intersecting_blocks(blockshape, roi, shape):
@@ -145,19 +155,40 @@ class OpRESTfulPrecomputedChunkedVolumeReaderNoCache(Operator):
         array_of_blocks, block_offsets, subimage_roi, subimage_shape = self.get_intersecting_blocks(
             blockshape=block_shape, roi=roi, shape=image_shape
         )
-        subimage = numpy.zeros((subimage_shape))
+        if (subimage_roi[0] == 0).all() and (subimage_roi[1] == subimage_shape).all():
+            # block aligned roi: the blocks tile the result exactly and can be
+            # written to it directly
+            subimage = result
+        else:
+            # allocate in the output dtype, so that neither the blocks nor the
+            # final result have to be converted when copying
+            subimage = numpy.zeros(subimage_shape, dtype=result.dtype)
         assert array_of_blocks.shape[-1] == 4
 
+        def download_block(block, block_out):
+            block_out[...] = self._volume_object.download_block(block, scale)
+
+        # Download the blocks concurrently, so that waiting for the server overlaps
+        # with decoding and copying the blocks that have already arrived
+        pool = RequestPool(max_active=self._volume_object.n_threads)
         for block, offset in zip(array_of_blocks, block_offsets):
             slicing = lazyflow.roi.roiToSlice(offset, offset + block_shape)
-            subimage[slicing] = self._volume_object.download_block(block, scale)
-        slicing = lazyflow.roi.roiToSlice(subimage_roi[0], subimage_roi[1])
-        result[...] = subimage[slicing]
+            pool.add(Request(partial(download_block, block, subimage[slicing])))
+        pool.wait()
+
+        if subimage is not result:
+            slicing = lazyflow.roi.roiToSlice(subimage_roi[0], subimage_roi[1])
+            result[...] = subimage[slicing]
         return result
 
     def propagateDirty(self, slot, subindex, roi):
         self.Output.setDirty(slice(None))
 
+    def cleanUp(self):
+        if self._volume_object is not None:
+            self._volume_object.close()
+        super().cleanUp()
+
 
 class OpRESTfulPrecomputedChunkedVolumeReader(Operator):
     fixAtCurrent = InputSlot(value=False, stype="bool")
@@ -187,8 +218,9 @@ class OpRESTfulPrecomputedChunkedVolumeReader(Operator):
         self.Output.connect(self.cache.Output)
 
     def setupOutputs(self):
-        # TODO: make this generic, for all dimensionalities
-        self.cache.BlockShape.setValue((1, 64, 64, 64))
+        # cache blocks that match the chunks of the remote volume, so that
+        # every chunk is only downloaded once
+        self.cache.BlockShape.setValue(self.RESTfulReader.Output.meta.ideal_blockshape)
 
     def propagateDirty(self, slot, subindex, roi):
         self.Output.setDirty(slice(None))
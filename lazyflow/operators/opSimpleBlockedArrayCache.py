@@ -6,7 +6,7 @@ from functools import partial
 from lazyflow.graph import Operator, InputSlot
 from .opUnblockedArrayCache import OpUnblockedArrayCache
 from lazyflow.request import Request, RequestPool
-from lazyflow.roi import getIntersectingRois, roiToSlice
+from lazyflow.roi import getIntersectingRois, getZOrder, roiToSlice
 from lazyflow.rtype import SubRegion
 
 
@@ -99,9 +99,13 @@ class OpSimpleBlockedArrayCache(OpUnblockedArrayCache):
         clipped_block_rois = getIntersectingRois(self.Input.meta.shape, self._blockshape, (roi.start, roi.stop), True)
         full_block_rois = getIntersectingRois(self.Input.meta.shape, self._blockshape, (roi.start, roi.stop), False)
 
+        # Submit the blocks along a Z-order curve instead of raster order:
+        # blocks that are processed at the same time are then close to each other in every dimension,
+        # and are more likely to share upstream data (e.g. cached source chunks or halos).
+        block_starts = [full_block_roi[0] for full_block_roi in full_block_rois]
         pool = RequestPool()
-        for full_block_roi, clipped_block_roi in zip(full_block_rois, clipped_block_rois):
-            req = Request(partial(copy_block, full_block_roi, clipped_block_roi))
+        for i in getZOrder(block_starts, self._blockshape):
+            req = Request(partial(copy_block, full_block_rois[i], clipped_block_rois[i]))
             pool.add(req)
         pool.wait()
 
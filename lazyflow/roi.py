@@ -643,6 +643,36 @@ def getIntersectingBlocks(blockshape, roi, asarray=False):
         return numpy.reshape(block_indices, (num_indexes, axiscount))
 
 
+def getZOrder(block_starts, blockshape):
+    """
+    Returns the indices that sort the given block start coordinates along a Z-order (Morton) curve.
+    Unlike the raster order returned by getIntersectingBlocks(), blocks that are adjacent in *any*
+    dimension stay close to each other, which keeps caches hot when the blocks are processed in order.
+
+    >>> block_starts = getIntersectingBlocks( (10, 10), [(0, 0),(40, 40)] )
+    >>> print(block_starts[getZOrder(block_starts, (10, 10))][:4])
+    [[ 0  0]
+     [ 0 10]
+     [10  0]
+     [10 10]]
+    """
+    block_starts = numpy.asarray(block_starts)
+    if len(block_starts) == 0:
+        return numpy.arange(0)
+
+    block_indices = (block_starts - block_starts.min(axis=0)) // numpy.asarray(blockshape)
+    num_bits = max(1, int(block_indices.max()).bit_length())
+
+    # Sorting by the interleaved bits of the block indices is the same as sorting by the morton code,
+    # but can't overflow. (numpy.lexsort uses the *last* key as primary key.)
+    keys = [
+        (block_indices[:, axis] >> bit) & 1
+        for bit in range(num_bits)
+        for axis in reversed(range(block_indices.shape[1]))
+    ]
+    return numpy.lexsort(keys)
+
+
 def getIntersectingRois(dataset_shape, blockshape, roi, clip_blocks_to_roi=True):
     block_starts = getIntersectingBlocks(blockshape, roi)
     block_rois = list(map(partial(getBlockBounds, dataset_shape, blockshape), block_starts))
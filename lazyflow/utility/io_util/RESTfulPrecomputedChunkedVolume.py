@@ -78,9 +78,12 @@ class RESTfulPrecomputedChunkedVolume(object):
         # might come in handy if one wants to process data on a different scale.
         # ilastik can only process data at a single scale.
         self._scale_info = None
+        self._scale_arrays = None
         self._json_info = None
         self._use_scale = "1_1_1"
         self.tmp_data_file = tmp_data_file
+        self.n_threads = n_threads
+        self._session = self._create_session()
         self.volume_url = volume_url
 
         # Assuming axes and dtype will be the same in every scale
@@ -90,7 +93,12 @@ class RESTfulPrecomputedChunkedVolume(object):
         self.n_channels = None
 
         if volume_url is not None:
-            self._init_config()
+            try:
+                self._init_config()
+            except Exception:
+                # the caller never gets hold of the volume to close it
+                self.close()
+                raise
 
     def _init_config(self, volume_url=None, volume_description=None):
         """Downloads and checks the volume info file
@@ -121,6 +129,21 @@ class RESTfulPrecomputedChunkedVolume(object):
         self.dtype = self._json_info["data_type"]
         self.n_channels = self._json_info["num_channels"]
 
+        # the getters below are called for every block, build their arrays only once
+        self._scale_arrays = {scale: self._make_scale_arrays(info) for scale, info in _scale_info.items()}
+
+    def _make_scale_arrays(self, scale_info):
+        scale_arrays = {
+            "block_shape": numpy.array([self.n_channels] + scale_info["chunk_sizes"][0][::-1]),
+            "resolution": numpy.array(scale_info["resolution"][::-1]),
+            "voxel_offset": numpy.array([0] + scale_info["voxel_offset"][::-1]),
+            "shape": numpy.array([self.n_channels] + scale_info["size"][::-1]),
+        }
+        # shared by all callers
+        for arr in scale_arrays.values():
+            arr.flags.writeable = False
+        return scale_arrays
+
     @staticmethod
     def determine_lowest_scale(scales_info_dict):
         scales = scales_info_dict.keys()
@@ -134,21 +157,17 @@ class RESTfulPrecomputedChunkedVolume(object):
     def get_block_shape(self, scale=None):
         if scale is None:
             scale = self._use_scale
-        n_channels = self.n_channels
-        block_shape = numpy.array([n_channels] + self._scale_info[scale]["chunk_sizes"][0][::-1])
-        return block_shape
+        return self._scale_arrays[scale]["block_shape"]
 
     def get_resolution(self, scale=None):
         if scale is None:
             scale = self._use_scale
-        resolution = numpy.array(self._scale_info[scale]["resolution"][::-1])
-        return resolution
+        return self._scale_arrays[scale]["resolution"]
 
     def get_voxel_offset(self, scale=None):
         if scale is None:
             scale = self._use_scale
-        voxel_offset = numpy.array([0] + self._scale_info[scale]["voxel_offset"][::-1])
-        return voxel_offset
+        return self._scale_arrays[scale]["voxel_offset"]
 
     def get_encoding(self, scale=None):
         if scale is None:
@@ -159,13 +178,11 @@ class RESTfulPrecomputedChunkedVolume(object):
     def get_shape(self, scale=None):
         if scale is None:
             scale = self._use_scale
-        n_channels = self.n_channels
-        shape = numpy.array([n_channels] + self._scale_info[scale]["size"][::-1])
-        return shape
+        return self._scale_arrays[scale]["shape"]
 
     def download_info(self):
         logger.debug(f"getting volume from {self.volume_url}/info")
-        r = requests.get(f"{self.volume_url}/info")
+        r = self._session.get(f"{self.volume_url}/info")
 
         # check if success:
         if r.status_code != 200:
@@ -201,18 +218,33 @@ class RESTfulPrecomputedChunkedVolume(object):
         """
         logger.debug(f"decoding encoding {encoding}; dtype {dtype}")
         if encoding == "raw":
-            raw = content
-            arr = numpy.fromstring(raw, dtype=dtype).reshape(shape)
+            # frombuffer wraps the downloaded bytes without copying them
+            # (the resulting array is read-only)
+            arr = numpy.frombuffer(content, dtype=dtype).reshape(shape)
             return arr
         else:
             raise NotImplementedError(f"encoding {encoding} not supported :(")
 
-    @staticmethod
-    def downloading(url):
+    def downloading(self, url):
         logger.debug(f"requesting {url}")
-        r = requests.get(url)
+        r = self._session.get(url)
         return r.content
 
+    def _create_session(self):
+        """
+        Generate a requests.Session object to use for this volume.
+        Blocks are downloaded concurrently, the connection pool is sized
+          so that every download can reuse an established connection.
+        """
+        session = requests.Session()
+        for prefix in ("http://", "https://"):
+            adapter = requests.adapters.HTTPAdapter(pool_connections=self.n_threads, pool_maxsize=self.n_threads)
+            session.mount(prefix, adapter)
+        return session
+
+    def close(self):
+        self._session.close()
+
     def generate_url(self, block_coordinates, scale=None):
         """Generate url to access a specific block
 
@@ -156,6 +156,15 @@ class TiledVolume(object):
             for dest in destinations:
                 self._slice_remapping[dest] = source
 
+        # The special functions are eval()'d once here instead of for every tile
+        self._z_translation_function = None
+        if self.description.z_translation_function is not None:
+            self._z_translation_function = eval(self.description.z_translation_function)
+
+        self._data_transform_function = None
+        if self.description.data_transform_function is not None:
+            self._data_transform_function = eval(self.description.data_transform_function)
+
     def close(self):
         if self._session:
             self._session.close()
@@ -247,9 +256,8 @@ class TiledVolume(object):
         }
 
         # Apply special z_translation_function
-        if self.description.z_translation_function is not None:
-            z_update_func = eval(self.description.z_translation_function)
-            rest_args["z_index"] = rest_args["z_start"] = z_update_func(rest_args["z_index"])
+        if self._z_translation_function is not None:
+            rest_args["z_index"] = rest_args["z_start"] = self._z_translation_function(rest_args["z_index"])
             rest_args["z_stop"] = 1 + rest_args["z_start"]
 
         # Quick sanity check
@@ -300,9 +308,8 @@ class TiledVolume(object):
         data_out[:] = img[roiToSlice(*tile_relative_intersection)]
 
         # If there's a special transform, apply it now.
-        if self.description.data_transform_function is not None:
-            transform = eval(self.description.data_transform_function)
-            data_out[:] = transform(data_out)
+        if self._data_transform_function is not None:
+            data_out[:] = self._data_transform_function(data_out)
 
     # For late imports
     requests = None
@@ -339,11 +346,13 @@ class TiledVolume(object):
                 TiledVolume.PIL = PIL
             PIL = TiledVolume.PIL
 
-            img = numpy.asarray(PIL.Image.open(BytesIO(r.content)))
+            img = PIL.Image.open(BytesIO(r.content))
             if self.description.is_rgb:
                 # "Convert" to grayscale -- just take first channel.
-                assert img.ndim == 3
-                img = img[..., 0]
+                # Selecting the band in PIL avoids converting the other channels to numpy, too.
+                assert len(img.getbands()) > 1
+                img = img.getchannel(0)
+            img = numpy.asarray(img)
             assert img.ndim == 2, (
                 "Image seems to be of the wrong dimension.  "
                 "If it is RGB, be sure to set the is_rgb flag in your description json."
@@ -361,9 +370,8 @@ class TiledVolume(object):
             data_out[:] = img[roiToSlice(*tile_relative_intersection)]
 
             # If there's a special transform, apply it now.
-            if self.description.data_transform_function is not None:
-                transform = eval(self.description.data_transform_function)
-                data_out[:] = transform(data_out)
+            if self._data_transform_function is not None:
+                data_out[:] = self._data_transform_function(data_out)
 
     def _create_session(self):
         """
@@ -325,7 +325,7 @@ class JsonConfigParser(object):
         namespace = Namespace()
         # Keys that the user gave us are
         for key, value in configDict.items():
-            if key in self._fields.keys():
+            if key in self._fields:
                 fieldType = self._fields[key]
                 try:
                     finalValue = self._transformValue(fieldType, value)
@@ -389,7 +389,7 @@ class JsonConfigParser(object):
         """
         ordered_dict = collections.OrderedDict()
         for k, v in pairList:
-            if k in list(ordered_dict.keys()) and k in list(self._fields.keys()):
+            if k in ordered_dict and k in self._fields:
                 raise JsonConfigParser.ParsingError("Invalid config: Duplicate entries for key: {}".format(k))
             # Insert the item
             ordered_dict[k] = v
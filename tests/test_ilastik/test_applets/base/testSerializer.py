@@ -41,6 +41,8 @@ from ilastik.applets.base.appletSerializer import (
     AppletSerializer,
     SerialDictSlot,
     SerialBlockSlot,
+    slicingToString,
+    stringToSlicing,
 )
 
 
@@ -127,6 +129,18 @@ class TestHDF5HelperFunctions(unittest.TestCase):
         shutil.rmtree(self.tmpDir)
 
 
+class TestSlicingStrings(unittest.TestCase):
+    def test_roundtrip(self):
+        slicing = [slice(0, 1), slice(2, 30), slice(4, 5)]
+        self.assertEqual(stringToSlicing(slicingToString(slicing)), slicing)
+        self.assertEqual(stringToSlicing("[0:1,2:30,4:5]"), slicing)
+
+    def test_malformed(self):
+        for strSlicing in ["", "[]", "0:1", "[0:1,2]", "[a:1]"]:
+            with self.assertRaises(ValueError):
+                stringToSlicing(strSlicing)
+
+
 class TestSerializer(unittest.TestCase):
     def setUp(self):
         g = Graph()
@@ -1,5 +1,8 @@
 import unittest
+from unittest import mock
+
 import numpy
+import vigra
 import fastfilters
 
 
@@ -127,3 +130,34 @@ class TestCarvingTools(unittest.TestCase):
         res = parallel_filter(name, x, sigma, outer_scale=outer_scale, max_workers=4)
         exp = fastfilters.structureTensorEigenvalues(x, sigma, outer_scale)
         assert numpy.allclose(res, exp)
+
+    def test_parallel_filter_block_error(self):
+        from ilastik.workflows.carving.carvingTools import parallel_filter
+
+        shape = 2 * (256,)
+        x = numpy.random.rand(*shape).astype("float32")
+
+        with mock.patch.object(fastfilters, "gaussianSmoothing", side_effect=RuntimeError("block failed")):
+            with self.assertRaisesRegex(RuntimeError, "block failed"):
+                parallel_filter("gaussianSmoothing", x, 1.6, max_workers=4)
+
+        # the thread pool is shared between calls, it has to stay usable after the failure
+        res = parallel_filter("gaussianSmoothing", x, 1.6, max_workers=4)
+        assert numpy.allclose(res, fastfilters.gaussianSmoothing(x, 1.6))
+
+    def test_parallel_watershed_block_error(self):
+        from ilastik.workflows.carving.carvingTools import parallel_watershed
+
+        shape = (400,) * 2
+        x = numpy.random.rand(*shape).astype("float32")
+
+        with mock.patch.object(vigra.analysis, "watershedsNew", side_effect=RuntimeError("block failed")):
+            with self.assertRaisesRegex(RuntimeError, "block failed"):
+                parallel_watershed(x, max_workers=4)
+
+        # the thread pool is shared between calls, it has to stay usable after the failure
+        seg, max_id = parallel_watershed(x, max_workers=4)
+        seg2, max_id2 = parallel_watershed(x, max_workers=4)
+        assert max_id == seg.max()
+        assert max_id2 == max_id
+        assert (seg2 == seg).all()
@@ -0,0 +1,53 @@
+###############################################################################
+#   ilastik: interactive learning and segmentation toolkit
+#
+#       Copyright (C) 2011-2020, the ilastik developers
+#                                <team@ilastik.org>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# In addition, as a special exception, the copyright holders of
+# ilastik give you permission to combine ilastik with applets,
+# workflows and plugins which are not covered under the GNU
+# General Public License.
+#
+# See the LICENSE file for details. License information is also available
+# on the ilastik web site at:
+# 		   http://ilastik.org/license.html
+###############################################################################
+from PyQt5.QtGui import QColor
+
+from ilastik.workflows.carving import colortables
+
+
+def _create_tables(order):
+    colortables._cached_random_colortable.cache_clear()
+    tables = {}
+    for name in order:
+        if name == "done":
+            tables[name] = colortables.done_segmentation_colortable()
+        else:
+            tables[name] = colortables.random_colortable(name)
+    return tables
+
+
+def test_tables_do_not_depend_on_creation_order():
+    tables = _create_tables([253, 256, "done"])
+    assert _create_tables(["done", 256, 253]) == tables
+    assert _create_tables([256, "done", 253]) == tables
+
+
+def test_done_segmentation_colortable():
+    colortable = colortables.done_segmentation_colortable()
+    assert len(colortable) == 256
+    assert colortable[0] == QColor(0, 0, 0, 0).rgba()
+    assert colortable[-1] == QColor(0, 255, 0).rgba()
+    for rgba in colortable[1:-1]:
+        color = QColor.fromRgba(rgba)
+        r, g, b = color.red(), color.green(), color.blue()
+        assert color.alpha() == 255
+        assert (255 - r) + g + b >= 128
+        assert r + (255 - g) + b >= 128
@@ -0,0 +1,156 @@
+###############################################################################
+#   lazyflow: data flow based lazy parallel computation framework
+#
+#       Copyright (C) 2011-2020, the ilastik developers
+#                                <team@ilastik.org>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the Lesser GNU General Public License
+# as published by the Free Software Foundation; either version 2.1
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# See the files LICENSE.lgpl2 and LICENSE.lgpl3 for full text of the
+# GNU Lesser General Public License version 2.1 and 3 respectively.
+# This information is also available on the ilastik web site at:
+# 		   http://ilastik.org/license/
+###############################################################################
+import numpy
+import pytest
+
+from lazyflow.graph import Graph
+from lazyflow.roi import roiToSlice
+from lazyflow.operators.ioOperators.opRESTfulPrecomputedChunkedVolumeReader import (
+    OpRESTfulPrecomputedChunkedVolumeReader,
+    OpRESTfulPrecomputedChunkedVolumeReaderNoCache,
+)
+from lazyflow.utility.io_util.RESTfulPrecomputedChunkedVolume import RESTfulPrecomputedChunkedVolume
+
+
+VOLUME_URL = "http://localhost/volume"
+BLOCK_SHAPE_ZYX = (10, 10, 10)
+# not a multiple of the block shape: blocks at the upper borders are clipped
+VOLUME_SHAPE_ZYX = (25, 23, 21)
+
+
+@pytest.fixture
+def reference_data():
+    shape_czyx = (1,) + VOLUME_SHAPE_ZYX
+    return numpy.arange(numpy.prod(shape_czyx), dtype="uint16").reshape(shape_czyx)
+
+
+@pytest.fixture
+def downloaded_urls(monkeypatch, reference_data):
+    """Serve the volume from reference_data instead of a server"""
+    volume_info = {
+        "type": "image",
+        "data_type": "uint16",
+        "num_channels": 1,
+        "scales": [
+            {
+                "key": "1_1_1",
+                "resolution": [1, 1, 1],
+                "chunk_sizes": [list(BLOCK_SHAPE_ZYX[::-1])],
+                "size": list(VOLUME_SHAPE_ZYX[::-1]),
+                "voxel_offset": [0, 0, 0],
+                "encoding": "raw",
+            }
+        ],
+    }
+    urls = []
+
+    def download_info(self):
+        self._json_info = volume_info
+
+    def downloading(self, url):
+        urls.append(url)
+        # urls end in {x_start}-{x_stop}_{y_start}-{y_stop}_{z_start}-{z_stop}
+        (x0, x1), (y0, y1), (z0, z1) = (map(int, r.split("-")) for r in url.rsplit("/", 1)[1].split("_"))
+        return reference_data[:, z0:z1, y0:y1, x0:x1].tobytes()
+
+    monkeypatch.setattr(RESTfulPrecomputedChunkedVolume, "download_info", download_info)
+    monkeypatch.setattr(RESTfulPrecomputedChunkedVolume, "downloading", downloading)
+    return urls
+
+
+@pytest.fixture
+def op_no_cache(downloaded_urls):
+    op = OpRESTfulPrecomputedChunkedVolumeReaderNoCache(graph=Graph())
+    op.BaseUrl.setValue(VOLUME_URL)
+    yield op
+    op.cleanUp()
+
+
+def test_cache_block_shape_matches_chunks(downloaded_urls):
+    op = OpRESTfulPrecomputedChunkedVolumeReader(graph=Graph())
+    op.BaseUrl.setValue(VOLUME_URL)
+
+    assert op.RESTfulReader.Output.meta.ideal_blockshape == (1,) + BLOCK_SHAPE_ZYX
+    assert tuple(op.cache.BlockShape.value) == (1,) + BLOCK_SHAPE_ZYX
+    op.cleanUp()
+
+
+def test_read_whole_volume(op_no_cache, downloaded_urls, reference_data):
+    # 3 * 3 * 3 blocks, blocks at the upper borders are clipped
+    data = op_no_cache.Output[:].wait()
+    assert data.dtype == reference_data.dtype
+    numpy.testing.assert_array_equal(data, reference_data)
+    assert len(downloaded_urls) == 27
+    assert len(set(downloaded_urls)) == 27
+
+
+def test_read_multi_block_roi(op_no_cache, downloaded_urls, reference_data):
+    # starts inside the first block along every axis, ends inside the clipped border blocks
+    roi = ((0, 5, 12, 3), (1, 25, 23, 19))
+    data = op_no_cache.Output(*roi).wait()
+    numpy.testing.assert_array_equal(data, reference_data[:, 5:25, 12:23, 3:19])
+    assert len(downloaded_urls) == 3 * 2 * 2
+
+
+def test_failed_download_is_raised(op_no_cache, monkeypatch):
+    def downloading(self, url):
+        if url.endswith("10-20_10-20_10-20"):
+            raise ValueError(f"could not download {url}")
+        return bytes(int(numpy.prod(BLOCK_SHAPE_ZYX)) * 2)
+
+    monkeypatch.setattr(RESTfulPrecomputedChunkedVolume, "downloading", downloading)
+    with pytest.raises(ValueError, match="could not download"):
+        op_no_cache.Output((0, 0, 0, 0), (1, 20, 20, 20)).wait()
+
+
+def _allocate_and_copy(op, roi):
+    """The reader's original code path: download into a block aligned subimage, then copy the roi"""
+    volume = op._volume_object
+    block_shape = volume.get_block_shape()
+    blocks, offsets, subimage_roi, subimage_shape = op.get_intersecting_blocks(
+        blockshape=block_shape, roi=roi, shape=volume.get_shape()
+    )
+    subimage = numpy.zeros(subimage_shape, dtype=volume.dtype)
+    for block, offset in zip(blocks, offsets):
+        subimage[roiToSlice(offset, offset + block_shape)] = volume.download_block(block)
+    return subimage[roiToSlice(*subimage_roi)]
+
+
+@pytest.mark.parametrize(
+    "roi",
+    [
+        # block aligned, written directly into the result
+        ((0, 10, 10, 0), (1, 20, 20, 10)),
+        ((0, 10, 20, 10), (1, 25, 23, 21)),
+        # not aligned, copied from a block aligned subimage
+        ((0, 3, 4, 5), (1, 17, 18, 9)),
+        ((0, 13, 2, 15), (1, 25, 23, 21)),
+    ],
+)
+def test_read_roi_matches_allocate_and_copy(op_no_cache, reference_data, roi):
+    start, stop = numpy.array(roi)
+    expected = _allocate_and_copy(op_no_cache, (start, stop))
+    numpy.testing.assert_array_equal(expected, reference_data[roiToSlice(start, stop)])
+
+    result = numpy.zeros(stop - start, dtype=reference_data.dtype)
+    op_no_cache.Output(start, stop).writeInto(result).wait()
+    numpy.testing.assert_array_equal(result, expected)
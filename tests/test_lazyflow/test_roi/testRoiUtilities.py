@@ -12,6 +12,7 @@ from lazyflow.roi import (
     nonzero_bounding_box,
     containing_rois,
     getIntersectingBlocks,
+    getZOrder,
 )
 
 
@@ -147,3 +148,20 @@ class TestGetIntersectionBlocks(TestCase):
 
         with self.assertRaises(AssertionError):
             getIntersectingBlocks(numpy.array((256, 256, 0, 2)), ([0, 0, 0, 0], [256, 256, 256, 2]))
+
+
+class TestGetZOrder(object):
+    def testBasic(self):
+        blockshape = (10, 20)
+        block_starts = getIntersectingBlocks(blockshape, ([-20, -40], [20, 40]))
+        order = getZOrder(block_starts, blockshape)
+
+        assert sorted(order) == list(range(len(block_starts)))
+        expected = [[-20, -40], [-20, -20], [-10, -40], [-10, -20], [-20, 0], [-20, 20], [-10, 0], [-10, 20]]
+        assert (block_starts[order][:8] == expected).all()
+
+    def testSingleBlock(self):
+        assert list(getZOrder([[0, 0, 0]], (10, 10, 10))) == [0]
+
+    def testEmpty(self):
+        assert len(getZOrder([], (10, 10))) == 0
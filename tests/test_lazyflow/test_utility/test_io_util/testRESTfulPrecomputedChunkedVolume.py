@@ -0,0 +1,107 @@
+###############################################################################
+#   lazyflow: data flow based lazy parallel computation framework
+#
+#       Copyright (C) 2011-2020, the ilastik developers
+#                                <team@ilastik.org>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the Lesser GNU General Public License
+# as published by the Free Software Foundation; either version 2.1
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# See the files LICENSE.lgpl2 and LICENSE.lgpl3 for full text of the
+# GNU Lesser General Public License version 2.1 and 3 respectively.
+# This information is also available on the ilastik web site at:
+# 		   http://ilastik.org/license/
+###############################################################################
+import numpy
+import pytest
+import requests
+
+from lazyflow.utility.io_util.RESTfulPrecomputedChunkedVolume import RESTfulPrecomputedChunkedVolume
+
+
+BLOCK_SHAPE_ZYX = (10, 10, 10)
+VOLUME_SHAPE_ZYX = (20, 20, 20)
+
+
+@pytest.fixture
+def volume_info():
+    return {
+        "type": "image",
+        "data_type": "uint8",
+        "num_channels": 1,
+        "scales": [
+            {
+                "key": "1_1_1",
+                "resolution": [1, 1, 1],
+                "chunk_sizes": [list(BLOCK_SHAPE_ZYX[::-1])],
+                "size": list(VOLUME_SHAPE_ZYX[::-1]),
+                "voxel_offset": [0, 0, 0],
+                "encoding": "raw",
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def volume(volume_info):
+    vol = RESTfulPrecomputedChunkedVolume(volume_url=None)
+    vol._init_config(volume_description=volume_info)
+
+    downloaded_urls = []
+
+    def downloading(url):
+        downloaded_urls.append(url)
+        return numpy.full(BLOCK_SHAPE_ZYX, len(downloaded_urls), dtype="uint8").tobytes()
+
+    vol.downloading = downloading
+    vol.downloaded_urls = downloaded_urls
+    return vol
+
+
+def test_scale_arrays(volume):
+    assert (volume.get_shape() == (1,) + VOLUME_SHAPE_ZYX).all()
+    assert (volume.get_block_shape() == (1,) + BLOCK_SHAPE_ZYX).all()
+    assert (volume.get_voxel_offset() == 0).all()
+    assert (volume.get_resolution() == 1).all()
+    # built once per configuration and shared between callers
+    assert volume.get_block_shape() is volume.get_block_shape("1_1_1")
+    assert not volume.get_shape().flags.writeable
+
+
+def test_download_block(volume):
+    block = volume.download_block((0, 10, 0, 0))
+    assert block.shape == (1,) + BLOCK_SHAPE_ZYX
+    assert (block == 1).all()
+    assert volume.downloaded_urls == ["None/1_1_1/0-10_0-10_10-20"]
+
+
+def test_decode_raw_content():
+    data = numpy.arange(2 * 3 * 4, dtype="uint16").reshape((1, 2, 3, 4))
+    decoded = RESTfulPrecomputedChunkedVolume.decode_content(
+        data.tobytes(), encoding="raw", shape=data.shape, dtype="uint16"
+    )
+    assert decoded.dtype == numpy.uint16
+    assert (decoded == data).all()
+    # wraps the downloaded buffer instead of copying it
+    assert not decoded.flags.writeable
+
+
+
+def test_session_is_closed_if_init_fails(monkeypatch):
+    closed_sessions = []
+    monkeypatch.setattr(requests.Session, "close", lambda session: closed_sessions.append(session))
+
+    def download_info(self):
+        raise ValueError("Could not find info file")
+
+    monkeypatch.setattr(RESTfulPrecomputedChunkedVolume, "download_info", download_info)
+    with pytest.raises(ValueError):
+        RESTfulPrecomputedChunkedVolume(volume_url="http://localhost/volume")
+    assert len(closed_sessions) == 1
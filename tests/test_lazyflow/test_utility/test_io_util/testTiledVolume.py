@@ -8,6 +8,7 @@ import sys
 import tempfile
 import numpy
 import h5py
+import vigra
 import copy
 import http.server
 import socket
@@ -58,6 +59,7 @@ class DataSetup(object):
         self.VOLUME_DESCRIPTION_FILE = None
         self.TRANSPOSED_VOLUME_DESCRIPTION_FILE = None
         self.TRANSLATED_VOLUME_DESCRIPTION_FILE = None
+        self.RGB_VOLUME_DESCRIPTION_FILE = None
 
         self.teardown = lambda: None
 
@@ -106,6 +108,7 @@ class DataSetup(object):
             self.TILE_DIRECTORY, "translated_volume_description.json"
         )
         self.SPECIAL_Z_VOLUME_DESCRIPTION_FILE = os.path.join(self.TILE_DIRECTORY, "special_z_volume_description.json")
+        self.RGB_VOLUME_DESCRIPTION_FILE = os.path.join(self.TILE_DIRECTORY, "rgb_volume_description.json")
 
         if not os.path.exists(self.TILE_DIRECTORY):
             print("Creating new tile directory: {}".format(self.TILE_DIRECTORY))
@@ -120,7 +123,7 @@ class DataSetup(object):
                 ref_vol = ref_file[ref_vol_path_comp.internalPath][:]
 
         need_rewrite = False
-        if not os.path.exists(self.VOLUME_DESCRIPTION_FILE):
+        if not os.path.exists(self.VOLUME_DESCRIPTION_FILE) or not os.path.exists(self.RGB_VOLUME_DESCRIPTION_FILE):
             need_rewrite = True
         else:
             with open(self.VOLUME_DESCRIPTION_FILE, "r") as f:
@@ -161,6 +164,13 @@ class DataSetup(object):
             special_z_description.z_translation_function = "lambda z: z+11"
             config_helper.writeConfigFile(self.SPECIAL_Z_VOLUME_DESCRIPTION_FILE, special_z_description)
 
+            # Write out another copy of the description, but for rgb tiles (see below)
+            config_helper = JsonConfigParser(TiledVolume.DescriptionFields)
+            rgb_description = copy.copy(volume_description)
+            rgb_description.tile_url_format = volume_description.tile_url_format.replace("/tile_z", "/rgb_tile_z")
+            rgb_description.is_rgb = True
+            config_helper.writeConfigFile(self.RGB_VOLUME_DESCRIPTION_FILE, rgb_description)
+
             # Remove all old image tiles in the tile directory
             files = os.listdir(self.TILE_DIRECTORY)
             for name in files:
@@ -170,6 +180,16 @@ class DataSetup(object):
             # Write the new tiles
             export_to_tiles(ref_vol, volume_description.tile_shape_2d_yx[0], self.TILE_DIRECTORY, print_progress=False)
 
+            # Write rgb tiles for slices 10 and 11 only, the data is in the first channel
+            tile_size = volume_description.tile_shape_2d_yx[0]
+            for z in range(10, 12):
+                for y in range(0, ref_vol.shape[1], tile_size):
+                    for x in range(0, ref_vol.shape[2], tile_size):
+                        tile = ref_vol[z, y : y + tile_size, x : x + tile_size]
+                        rgb_tile = vigra.taggedView(numpy.stack([tile, 255 - tile, tile // 2], axis=-1), "yxc")
+                        name = "rgb_tile_z{:05}_y{:05}_x{:05}.png".format(z, y, x)
+                        vigra.impex.writeImage(rgb_tile, os.path.join(self.TILE_DIRECTORY, name), dtype="NATIVE")
+
             # To support testMissingTiles (below), remove slice 2
             files = os.listdir(self.TILE_DIRECTORY)
             for name in files:
@@ -376,6 +396,30 @@ class TestViewOriginOffset(object):
         assert (expected == result_out).all()
 
 
+class TestRgbTiles(object):
+    @classmethod
+    def setup_class(cls):
+        cls.data_setup = DataSetup()
+        cls.data_setup.setup()
+
+    @classmethod
+    def teardown_class(cls):
+        cls.data_setup.teardown()
+
+    def test_first_channel(self):
+        tiled_volume = TiledVolume(self.data_setup.RGB_VOLUME_DESCRIPTION_FILE)
+        roi = numpy.array([(10, 150, 100), (12, 550, 550)])
+        result_out = numpy.zeros(roi[1] - roi[0], dtype=tiled_volume.description.dtype)
+        tiled_volume.read(roi, result_out)
+
+        ref_path_comp = PathComponents(self.data_setup.REFERENCE_VOL_PATH)
+        with h5py.File(ref_path_comp.externalPath, "r") as f:
+            ref_data = f[ref_path_comp.internalPath][:]
+
+        expected = ref_data[roiToSlice(*roi)]
+        assert (expected == result_out).all()
+
+
 class TestSpecialZTranslation(object):
     @classmethod
     def setup_class(cls):